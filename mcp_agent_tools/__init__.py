@@ -5,36 +5,42 @@ This package provides classes for:
 1. Connecting to MCP servers via stdio or SSE
 2. Managing MCP tools
 3. Converting MCP tools to SmolAgents tools
+
+Exports are imported on first access (PEP 562), so importing the package
+does not load the MCP SDK or smolagents until they are needed.
 """
 
-from .models import MCPTool
-from .mcp_tool_service import MCPClient, MCPToolService
-from .smol_mcp_tool_factory import SmolMCPToolFactory
-from .smol_tool_converter import MCPToSmolToolConverter, convert_mcp_to_smol
-from .exceptions import (
-    MCPAgentToolsError,
-    ConnectionError,
-    ToolCallError,
-    ToolNotFoundError,
-    ConversionError,
-    InvalidArgumentError,
-    ServiceError,
-    TimeoutError,
-)
-
-__all__ = [
-    'MCPTool',
-    'MCPClient',
-    'MCPToolService',
-    'SmolMCPToolFactory',
-    'MCPToSmolToolConverter',
-    'convert_mcp_to_smol',
-    'MCPAgentToolsError',
-    'ConnectionError',
-    'ToolCallError',
-    'ToolNotFoundError',
-    'ConversionError',
-    'InvalidArgumentError',
-    'ServiceError',
-    'TimeoutError',
-] 
\ No newline at end of file
+import importlib
+
+# Public name -> (module, attribute)
+_EXPORTS = {
+    'MCPTool': ('.models', 'MCPTool'),
+    'MCPClient': ('.mcp_tool_service', 'MCPClient'),
+    'MCPToolService': ('.mcp_tool_service', 'MCPToolService'),
+    'SmolMCPToolFactory': ('.smol_mcp_tool_factory', 'SmolMCPToolFactory'),
+    'MCPToSmolToolConverter': ('.smol_tool_converter', 'MCPToSmolToolConverter'),
+    'convert_mcp_to_smol': ('.smol_tool_converter', 'convert_mcp_to_smol'),
+    'MCPAgentToolsError': ('.exceptions', 'MCPAgentToolsError'),
+    'ConnectionError': ('.exceptions', 'ConnectionError'),
+    'ToolCallError': ('.exceptions', 'ToolCallError'),
+    'ToolNotFoundError': ('.exceptions', 'ToolNotFoundError'),
+    'ConversionError': ('.exceptions', 'ConversionError'),
+    'InvalidArgumentError': ('.exceptions', 'InvalidArgumentError'),
+    'ServiceError': ('.exceptions', 'ServiceError'),
+    'TimeoutError': ('.exceptions', 'TimeoutError'),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module_name, attr = _EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
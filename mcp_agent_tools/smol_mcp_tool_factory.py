@@ -1,34 +1,163 @@
+import asyncio
 import inspect
 import logging
 import functools
-from typing import Dict, Any, Optional, Callable, List, Tuple, Type
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Callable, List, Tuple, Type, TYPE_CHECKING
 import sys
-from mcp.types import CallToolResult
 # Import MCP related classes
 from .models import MCPTool
 from .mcp_tool_service import MCPToolService
 from .smol_tool_converter import MCPToSmolToolConverter, convert_mcp_to_smol
-from smolagents.tools import ToolCollection
-# Try to import SmolTool, but create a fallback if not available
-try:
+from .exceptions import ConversionError, ServiceError
+
+# smolagents is imported on first use, it is expensive to load
+if TYPE_CHECKING:
     from smolagents.tools import Tool as SmolTool
-except ImportError:
-    # Create a minimal version for testing/type checking
-    class SmolTool:
-        """Fallback implementation when smolagents is not installed."""
-        name = ""
-        description = ""
-        inputs = {}
-        output_type = "string"
-        
-        def __init__(self, **kwargs):
-            pass
+
+# Default directory for the persisted tool catalog
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mcp_agent_tools")
+
+class _CircuitBreaker:
+    """
+    Minimal circuit breaker for calls to a failing service.
+    
+    After fail_threshold consecutive failures the breaker opens and calls are
+    rejected for cooldown seconds. After that a single trial call is let
+    through while other callers are still rejected: success closes the
+    breaker, failure opens it again. A trial that never reports back is
+    given up after another cooldown.
+    """
+    
+    def __init__(self, fail_threshold: int = 3, cooldown: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.fail_count = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+        
+    def is_open(self) -> bool:
+        """Check whether calls should be rejected right now."""
+        with self._lock:
+            if self.state == "closed":
+                return False
+            now = time.monotonic()
+            if now >= self.open_until:
+                # Cooldown over, this caller makes the one trial call
+                self.state = "half_open"
+                self.open_until = now + self.cooldown
+                return False
+            return True
+            
+    def record_success(self):
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self.state = "closed"
+            self.fail_count = 0
+            
+    def record_failure(self):
+        """Count a failed call, opening the breaker if needed."""
+        with self._lock:
+            self.fail_count += 1
+            if self.state == "half_open" or self.fail_count >= self.fail_threshold:
+                self.state = "open"
+                self.open_until = time.monotonic() + self.cooldown
+
+class _PooledService:
+    """Pool entry: a shared service, its reference count and whether it has finished starting."""
+    
+    def __init__(self):
+        self.service: Optional[MCPToolService] = None
+        self.refcount = 0
+        self.ready = threading.Event()
+        self.failed = False
+
+# Services shared between factories with the same connection parameters
+_SERVICE_POOL: Dict[tuple, _PooledService] = {}
+_SERVICE_POOL_LOCK = threading.Lock()
+
+def _acquire_pooled_service(pool_key: tuple, create_service: Callable[[], MCPToolService]) -> Tuple[MCPToolService, bool]:
+    """
+    Get the running service for pool_key, or create and start a new one.
+    
+    The first caller for a key reserves a pool entry and starts the service
+    outside the pool lock, so factories for different servers don't wait on
+    each other. Concurrent callers for the same key wait for that start
+    instead of spawning their own service. Only a started service is kept
+    in the pool.
+    
+    Args:
+        pool_key: The connection parameters identifying the service
+        create_service: Callable creating a new, not yet started service
+        
+    Returns:
+        Tuple of (service, pooled). If pooled is False the service failed
+        to start and belongs to the caller alone.
+    """
+    while True:
+        with _SERVICE_POOL_LOCK:
+            entry = _SERVICE_POOL.get(pool_key)
+            dead = entry is not None and entry.ready.is_set() and not entry.service.running
+            creator = entry is None or dead
+            if creator:
+                entry = _PooledService()
+                _SERVICE_POOL[pool_key] = entry
+            entry.refcount += 1
             
-        def forward(self, **kwargs):
-            pass
+        if not creator:
+            entry.ready.wait()
+            if entry.failed:
+                # The start we waited for failed, try again
+                continue
+            return entry.service, True
             
-        def validate_arguments(self):
-            pass
+        service = None
+        started = False
+        try:
+            service = create_service()
+            started = service.start()
+        finally:
+            with _SERVICE_POOL_LOCK:
+                if started:
+                    entry.service = service
+                else:
+                    entry.failed = True
+                    if _SERVICE_POOL.get(pool_key) is entry:
+                        del _SERVICE_POOL[pool_key]
+            entry.ready.set()
+            
+        return service, started
+
+def _close_service(service: MCPToolService, own_service: List[bool], pool_key: Optional[tuple], logger: logging.Logger):
+    """
+    Stop a factory's service if the factory owns it.
+    
+    Pooled services are only stopped when their last factory releases them.
+    Registered with weakref.finalize, so it must not reference the factory itself;
+    own_service is the factory's one-item ownership flag, read at close time.
+    """
+    if pool_key is not None:
+        with _SERVICE_POOL_LOCK:
+            entry = _SERVICE_POOL.get(pool_key)
+            if entry is not None and entry.service is service:
+                entry.refcount -= 1
+                if entry.refcount > 0:
+                    return
+                del _SERVICE_POOL[pool_key]
+        service.stop()
+        logger.info("Closed pooled MCPToolService")
+        return
+        
+    if own_service[0]:
+        service.stop()
+        logger.info("Closed MCPToolService owned by factory")
 
 class SmolMCPToolFactory:
     """
@@ -47,7 +176,12 @@ class SmolMCPToolFactory:
         env: Optional[Dict[str, str]] = None,
         sampling_callback: Optional[Callable] = None,
         logger: Optional[logging.Logger] = None,
-        own_service: bool = True
+        own_service: bool = True,
+        share_service: bool = True,
+        cache_ttl_seconds: float = 300.0,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        prewarm: bool = False,
+        prewarm_timeout: float = 30.0
     ):
         """
         Initialize the SmolMCPToolFactory.
@@ -66,38 +200,94 @@ class SmolMCPToolFactory:
             logger: Logger instance to use
             own_service: Whether this factory owns the service and should close it on cleanup
                          (set to False if you want to manage the service lifecycle externally)
+            share_service: Whether a new service may be shared with other factories using the
+                           same connection parameters; it is stopped when the last one closes.
+                           A shared service logs to the logger of the factory that started it
+            cache_ttl_seconds: How long a discovered tool catalog is reused before
+                               the server is asked again
+            cache_dir: Directory where the tool catalog is persisted between processes
+                       (set to None to keep the cache in memory only)
+            prewarm: Whether to discover and convert the tools in a background thread
+                     right away, so the first get_smolagent_tools() call returns instantly
+            prewarm_timeout: How long get_smolagent_tools() waits for a running prewarm
+                             before converting the tools itself
         """
         # Set up logger
         self.logger = logger or logging.getLogger(__name__)
 
-        # Flag to track whether we own the service and should close it on cleanup
-        self.own_service = own_service
+        # Flag to track whether we own the service and should close it on cleanup,
+        # kept in a list so the finalizer sees later changes to it
+        self._own_service = [own_service]
         
         # Use the provided service or create a new one
+        pool_key = None
         if service is not None:
             self.service = service
             self.started = service.connected  # Use the service's connection status
             if not self.started:
                 self.logger.warning("Provided MCPToolService is not connected")
         else:
-            # Initialize a new MCP Tool Service
-            self.service = MCPToolService(
-                server_url=server_url,
-                command=command,
-                args=args,
-                env=env,
-                sampling_callback=sampling_callback,
-                logger=self.logger
-            )
-            
-            # Start the service
-            self.started = self.service.start()
+            def create_service():
+                # Initialize a new MCP Tool Service
+                return MCPToolService(
+                    server_url=server_url,
+                    command=command,
+                    args=args,
+                    env=env,
+                    sampling_callback=sampling_callback,
+                    logger=self.logger
+                )
+                
+            if share_service:
+                try:
+                    pool_key = (
+                        server_url, command, tuple(args or ()),
+                        frozenset((env or {}).items()), sampling_callback
+                    )
+                    hash(pool_key)
+                except TypeError:
+                    # Unhashable connection parameters can't be pooled
+                    pool_key = None
+                    
+            if pool_key is not None:
+                # Reuse a running service for the same server, or start one
+                self.service, pooled = _acquire_pooled_service(pool_key, create_service)
+                if not pooled:
+                    pool_key = None
+                self.started = self.service.connected
+            else:
+                self.service = create_service()
+                
+                # Start the service
+                self.started = self.service.start()
+                
             if not self.started:
                 self.logger.error("Failed to start MCP Tool Service")
                 
-            # We own this service since we created it
-            self.own_service = True
+            # We own this service since we created it, unless it is shared through the pool
+            self.own_service = pool_key is None
             
+        # Close the service when the factory is closed or garbage collected
+        self._finalizer = weakref.finalize(
+            self, _close_service, self.service, self._own_service, pool_key, self.logger
+        )
+        
+        # Tool catalog cache, invalidated by TTL or by invalidate_cache()
+        self._tools_cache_ttl = cache_ttl_seconds
+        self._tool_info_cache: Optional[List[Dict[str, Any]]] = None
+        self._tool_info_cache_ts = 0.0
+        self._tools_cache_key = self._make_cache_key()
+        self._cache_dir = cache_dir
+        self._cache_lock = threading.RLock()
+        self._breaker = _CircuitBreaker(fail_threshold=3, cooldown=30.0)
+        self._smol_tools_cache: Optional[List[Any]] = None
+        self._smol_tools_cache_ts = 0.0
+        
+        # Background discovery state
+        self._prewarm_event = threading.Event()
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self._prewarm_timeout = prewarm_timeout
+        
         # Dictionary to store original functions
         self.original_functions = {}
         
@@ -109,6 +299,10 @@ class SmolMCPToolFactory:
         
         # Load all tools and create wrapper functions immediately
         self._load_tools_and_create_wrappers()
+        
+        # Optionally convert the tools ahead of the first request
+        if prewarm:
+            self.prewarm()
     
     def _load_tools_and_create_wrappers(self):
         """
@@ -129,18 +323,29 @@ class SmolMCPToolFactory:
                     name = func.name
                     self.original_functions[name] = func
                     self.wrapper_functions[name] = func  # No wrapper needed
-                    self.logger.debug(f"Stored enhanced function: {name}")
+                    self.logger.debug("Stored enhanced function: %s", name)
                     
                     # Log the inputs to help debug parameter mapping
                     if hasattr(func, 'inputs'):
-                        self.logger.info(f"Tool '{name}' has inputs: {func.inputs}")
+                        self.logger.info("Tool '%s' has inputs: %s", name, func.inputs)
                 else:
                     self.logger.warning(f"Tool function has no name attribute")
-        except Exception as e:
-            self.logger.error(f"Error loading tools: {e}")
+        except ServiceError as e:
+            self.logger.error("Error loading tools: %s", e)
     
-    def __del__(self):
-        """Clean up resources when the factory is garbage collected."""
+    @property
+    def own_service(self) -> bool:
+        """Whether close() stops the service; can be changed until the factory is closed."""
+        return self._own_service[0]
+        
+    @own_service.setter
+    def own_service(self, value: bool):
+        self._own_service[0] = value
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
     
     def close(self):
@@ -148,11 +353,11 @@ class SmolMCPToolFactory:
         Stop the MCP Tool Service if we own it.
         
         If the service was provided externally and own_service is False,
-        this method won't close the service.
+        this method won't close the service. Calling close() more than once
+        is safe; it is also called automatically when the factory is
+        garbage collected or the interpreter exits.
         """
-        if hasattr(self, 'service') and self.own_service:
-            self.service.stop()
-            self.logger.info("Closed MCPToolService owned by factory")
+        self._finalizer()
             
     @classmethod
     def from_service(cls, service: MCPToolService, own_service: bool = False):
@@ -177,7 +382,12 @@ class SmolMCPToolFactory:
         sampling_callback: Optional[Callable] = None,
         logger: Optional[logging.Logger] = None,
         connection_timeout: float = 10.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        share_service: bool = True,
+        cache_ttl_seconds: float = 300.0,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        prewarm: bool = False,
+        prewarm_timeout: float = 30.0
     ):
         """
         Create a SmolMCPToolFactory with a new MCPToolService.
@@ -191,6 +401,11 @@ class SmolMCPToolFactory:
             logger: Logger instance to use
             connection_timeout: Timeout in seconds for connection attempts
             max_retries: Maximum number of connection retry attempts
+            share_service: Whether the service may be shared with factories for the same server
+            cache_ttl_seconds: How long a discovered tool catalog is reused
+            cache_dir: Directory where the tool catalog is persisted (None disables it)
+            prewarm: Whether to discover and convert the tools in a background thread
+            prewarm_timeout: How long get_smolagent_tools() waits for a running prewarm
             
         Returns:
             A SmolMCPToolFactory instance with a new service
@@ -202,28 +417,239 @@ class SmolMCPToolFactory:
             env=env,
             sampling_callback=sampling_callback,
             logger=logger,
-            own_service=True
+            own_service=True,
+            share_service=share_service,
+            cache_ttl_seconds=cache_ttl_seconds,
+            cache_dir=cache_dir,
+            prewarm=prewarm,
+            prewarm_timeout=prewarm_timeout
         )
     
+    @classmethod
+    async def acreate_many(cls, configs: List[Dict[str, Any]], **factory_kwargs) -> List['SmolMCPToolFactory']:
+        """
+        Create one factory per server, starting the services concurrently.
+        
+        Each service start blocks until the server connects, so starting them
+        in parallel makes total startup time that of the slowest server rather
+        than the sum of all of them.
+        
+        Args:
+            configs: MCPToolService keyword arguments, one dictionary per server
+            **factory_kwargs: Extra arguments passed to every factory
+            
+        Returns:
+            The factories, in the same order as configs. Each one owns its service.
+            
+        Raises:
+            ValueError: If factory_kwargs contains service or own_service
+        """
+        reserved = sorted({"service", "own_service"} & factory_kwargs.keys())
+        if reserved:
+            raise ValueError(f"acreate_many() creates the services itself, got {', '.join(reserved)}")
+            
+        services = []
+        try:
+            for config in configs:
+                services.append(MCPToolService(**config))
+            results = await asyncio.gather(
+                *(asyncio.to_thread(service.start) for service in services),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return [cls(service=service, own_service=True, **factory_kwargs) for service in services]
+        except BaseException:
+            # Don't leak the services started so far; stopping one twice is harmless
+            for service in services:
+                service.stop()
+            raise
+        
+    @classmethod
+    def create_many(cls, configs: List[Dict[str, Any]], **factory_kwargs) -> List['SmolMCPToolFactory']:
+        """
+        Synchronous wrapper around acreate_many().
+        
+        Must not be called from a running event loop; await acreate_many() there instead.
+        
+        Args:
+            configs: MCPToolService keyword arguments, one dictionary per server
+            **factory_kwargs: Extra arguments passed to every factory
+            
+        Returns:
+            The factories, in the same order as configs
+        """
+        return asyncio.run(cls.acreate_many(configs, **factory_kwargs))
+    
+    def _make_cache_key(self) -> str:
+        """
+        Build the key identifying the tool catalog of the configured server.
+        
+        Returns:
+            A short hash of the service connection parameters.
+        """
+        config = (
+            getattr(self.service, 'server_url', None),
+            getattr(self.service, 'command', None),
+            tuple(getattr(self.service, 'args', None) or ()),
+        )
+        return hashlib.sha256(repr(config).encode("utf-8")).hexdigest()[:16]
+    
+    def _cache_is_fresh(self, timestamp: float) -> bool:
+        """Check whether a cache entry stored at the given monotonic time is still valid."""
+        return time.monotonic() - timestamp < self._tools_cache_ttl
+    
+    def invalidate_cache(self):
+        """
+        Drop the cached tool catalog so the next lookup asks the server again.
+        
+        This clears both the in-memory cache and the catalog persisted on disk.
+        """
+        self._tool_info_cache = None
+        self._tool_info_cache_ts = 0.0
+        self._smol_tools_cache = None
+        self._smol_tools_cache_ts = 0.0
+        
+        cache_path = self._cache_path()
+        if cache_path and os.path.exists(cache_path):
+            try:
+                os.remove(cache_path)
+            except OSError as e:
+                self.logger.warning("Could not remove tool catalog cache %s: %s", cache_path, e)
+    
+    def _cache_path(self) -> Optional[str]:
+        """Return the path of the persisted tool catalog, or None if persistence is disabled."""
+        if not self._cache_dir:
+            return None
+        return os.path.join(self._cache_dir, f"{self._tools_cache_key}.json")
+    
+    def _load_tool_info_from_disk(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the persisted tool catalog if it exists and has not expired.
+        
+        Returns:
+            The list of tool information dictionaries, or None on a cache miss.
+        """
+        cache_path = self._cache_path()
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+            
+        try:
+            with open(cache_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable tool catalog cache %s: %s", cache_path, e)
+            return None
+            
+        created = data.get("created") if isinstance(data, dict) else None
+        tools = data.get("tools") if isinstance(data, dict) else None
+        if (not isinstance(created, (int, float)) or isinstance(created, bool)
+                or not isinstance(tools, list)
+                or not all(isinstance(tool, dict) and "name" in tool and "inputs" in tool for tool in tools)):
+            self.logger.warning("Ignoring malformed tool catalog cache %s", cache_path)
+            return None
+            
+        if not tools or time.time() - created >= self._tools_cache_ttl:
+            return None
+        self.logger.debug("Loaded tool catalog from %s", cache_path)
+        return tools
+    
+    def _save_tool_info_to_disk(self, tool_info_list: List[Dict[str, Any]]):
+        """
+        Persist the tool catalog so a new process can skip discovery.
+        
+        Args:
+            tool_info_list: The list of tool information dictionaries to store
+        """
+        cache_path = self._cache_path()
+        if not cache_path:
+            return
+            
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump({"created": time.time(), "tools": tool_info_list}, fh)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Could not persist tool catalog to %s: %s", cache_path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
     def _get_tools(self) -> List[Callable]:
         """
         Get all available tools as callable functions with metadata.
         
+        After repeated failures, calls fail fast for a cooldown period
+        instead of hitting the service again.
+        
         Returns:
             List of callable functions with metadata.
+            
+        Raises:
+            ServiceError: If the service fails to return its tools
         """
         if not self.started:
             self.logger.warning("MCP Tool Service is not started or not connected to server")
             return []
         
+        if self._breaker.is_open():
+            raise ServiceError(
+                f"Not retrieving tools: {self._breaker.fail_count} consecutive failures, "
+                f"retrying after the {self._breaker.cooldown}s cooldown"
+            )
+        
         try:
             # Get the callable functions from the service
             functions = self.service.get_tools()
-            self.logger.info(f"Retrieved {len(functions)} callable tool functions")
-            return functions
-        except Exception as e:
-            self.logger.error(f"Error retrieving tools: {e}")
-            return []
+        except (RuntimeError, OSError) as e:
+            self._breaker.record_failure()
+            self.logger.error("Error retrieving tools: %s", e)
+            raise ServiceError(str(e)) from e
+            
+        self._breaker.record_success()
+        self.logger.info("Retrieved %d callable tool functions", len(functions))
+        return functions
+    
+    def _get_tool_info_list(self) -> List[Dict[str, Any]]:
+        """
+        Get the name, description, inputs and output type of every server tool.
+        
+        The catalog is served from memory or from the persisted cache when
+        possible, and only fetched from the server on a miss.
+        
+        Returns:
+            List of tool information dictionaries.
+        """
+        with self._cache_lock:
+            if self._tool_info_cache is not None and self._cache_is_fresh(self._tool_info_cache_ts):
+                return self._tool_info_cache
+            
+            tool_info_list = self._load_tool_info_from_disk()
+            if tool_info_list is None:
+                from smolagents.tools import ToolCollection
+                
+                tool_info_list = []
+                with ToolCollection.from_mcp({"url": "http://localhost:8000/sse"}) as tool_collection:
+                    for tool in tool_collection.tools:
+                        tool_info = {
+                            "name": tool.name,
+                            "description": tool.description,
+                            "inputs": tool.inputs,
+                            "output_type": tool.output_type
+                        }
+                        tool_info_list.append(tool_info)
+                    self.logger.info("Retrieved tool information: %s", tool_info_list)
+                    
+                # Don't cache an empty catalog, the server may still be loading its tools
+                if not tool_info_list:
+                    return tool_info_list
+                self._save_tool_info_to_disk(tool_info_list)
+            
+            self._tool_info_cache = tool_info_list
+            self._tool_info_cache_ts = time.monotonic()
+            return tool_info_list
     
     
     def mcp_to_smolagent_tool(self, mcp_tool: Callable) -> 'SmolTool':
@@ -235,36 +661,70 @@ class SmolMCPToolFactory:
             
         Returns:
             A SmolAgents Tool object
-
+            
+        Raises:
+            ConversionError: If the tool can't be converted, including when
+                the tool catalog can't be loaded
+        """
+        try:
+            tool_info_list = self._get_tool_info_list()
+        except Exception as e:
+            # The catalog comes from an MCP client session, which can fail
+            # with any connection or transport error
+            self.logger.error("Error loading the tool catalog for %s: %s", getattr(mcp_tool, 'name', mcp_tool), e)
+            raise ConversionError(f"Could not load the tool catalog: {e}") from e
+        
+        try:
+            # Check if we can find this tool in the collected tools by name
+            skip_validation = False
+            for tool_info in tool_info_list:
+                if tool_info['name'] == mcp_tool.name:
+                    # Override the inputs with what's in the tool collection
+                    mcp_tool.inputs = tool_info['inputs']
+                    # For any tool with matching name in tool_info_list, skip validation
+                    skip_validation = True
+                    break
+                
+            # Convert the tool; the converter logs a single record per created tool
+            return self.converter.convert(mcp_tool, skip_validation=skip_validation)
+        except (ConversionError, AttributeError, TypeError, KeyError, ValueError, AssertionError, SyntaxError) as e:
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error(
+                    "Error converting %s to SmolAgents Tool: %s",
+                    getattr(mcp_tool, 'name', mcp_tool), e, exc_info=True
+                )
+            if isinstance(e, ConversionError):
+                raise
+            raise ConversionError(str(e)) from e
+        
+    def prewarm(self):
+        """
+        Discover and convert the tools in a background thread.
+        
+        The converted tools are cached, so a later get_smolagent_tools() call
+        returns them without waiting for discovery. Calling this while a
+        prewarm is already running does nothing.
         """
-        tool_info_list= []
-        with ToolCollection.from_mcp({"url": "http://localhost:8000/sse"}) as tool_collection:
-            for tool in tool_collection.tools:
-                tool_info = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputs": tool.inputs,
-                    "output_type": tool.output_type
-                }
-                tool_info_list.append(tool_info)
-            self.logger.info(f"Retrieved tool information: {tool_info_list}")
-        
-        # Check if we can find this tool in the collected tools by name
-        for tool_info in tool_info_list:
-            if tool_info['name'] == mcp_tool.name:
-                # Override the inputs with what's in the tool collection
-                mcp_tool.inputs = tool_info['inputs']
-                self.logger.info(f"Updated inputs for tool {mcp_tool.name}")
-                break
+        if not self.started:
+            self.logger.warning("MCP Tool Service is not started, cannot prewarm tools")
+            return
             
-        # For any tool with matching name in tool_info_list, skip validation
-        skip_validation = any(tool_info['name'] == mcp_tool.name for tool_info in tool_info_list)
-        if skip_validation:
-            self.logger.info(f"Skipping validation for tool {mcp_tool.name}")
+        if self._prewarm_thread is not None and self._prewarm_thread.is_alive():
+            return
             
-        # Convert the tool
-        return self.converter.convert(mcp_tool, skip_validation=skip_validation)
+        self._prewarm_event.clear()
+        self._prewarm_thread = threading.Thread(target=self._prewarm, daemon=True)
+        self._prewarm_thread.start()
         
+    def _prewarm(self):
+        """Background thread target that fills the SmolAgents tool cache."""
+        try:
+            self._build_smolagent_tools()
+        except Exception as e:
+            self.logger.error("Error prewarming tools: %s", e)
+        finally:
+            self._prewarm_event.set()
+    
     def get_smolagent_tools(self) -> List[Any]:
         """
         Get all available tools as SmolAgents Tool objects.
@@ -273,30 +733,73 @@ class SmolMCPToolFactory:
         The other method (_get_tools) is a private implementation detail
         and should not be used directly.
         
+        Converted tools are cached for cache_ttl_seconds. If a prewarm is
+        running, this waits up to prewarm_timeout for it before converting
+        the tools itself.
+        
         Returns:
             List of SmolAgents Tool objects for agent use
+            
+        Raises:
+            ServiceError: If the tools can't be retrieved from the service
         """
+        if self._prewarm_thread is not None and not self._prewarm_event.is_set():
+            if not self._prewarm_event.wait(self._prewarm_timeout):
+                self.logger.warning(
+                    "Tool prewarm did not finish within %ss, converting tools now", self._prewarm_timeout
+                )
+                
+        # Don't serve cached tools from a dead connection, rebuilding reports the error
+        if (self._smol_tools_cache is not None and self._cache_is_fresh(self._smol_tools_cache_ts)
+                and self.service.connected):
+            return list(self._smol_tools_cache)
             
+        return self._build_smolagent_tools()
+    
+    def _build_smolagent_tools(self) -> List[Any]:
+        """
+        Convert all available tools to SmolAgents Tool objects and cache them.
+        
+        Returns:
+            List of SmolAgents Tool objects
+        """
         # Get the MCPTool objects
         mcp_tools = self._get_tools()
         
-        # Convert to SmolAgents Tool objects
-        smolagent_tools = []
+        # Convert to SmolAgents Tool objects, keeping the original order
+        converted: List[Any] = [None] * len(mcp_tools)
         
-        # Process all tools
-        for tool in mcp_tools:
-            try:
-                # Convert the tool
-                smolagent_tool = self.mcp_to_smolagent_tool(tool)
-                smolagent_tools.append(smolagent_tool)
-                self.logger.info(f"Converted tool {tool.name}")
-            except Exception as e:
-                self.logger.error(f"Error converting {tool.name} to SmolAgents Tool: {e}")
+        # Process all tools in parallel
+        with ThreadPoolExecutor(max_workers=min(16, len(mcp_tools) or 1)) as executor:
+            futures = {
+                executor.submit(self.mcp_to_smolagent_tool, tool): index
+                for index, tool in enumerate(mcp_tools)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                tool = mcp_tools[index]
+                error = future.exception()
+                if error is not None:
+                    # ConversionErrors were already logged by mcp_to_smolagent_tool
+                    if not isinstance(error, ConversionError):
+                        self.logger.error("Error converting %s to SmolAgents Tool: %s", tool.name, error)
+                    continue
+                converted[index] = future.result()
+                
+        smolagent_tools = [tool for tool in converted if tool is not None]
                 
-        self.logger.info(f"Converted {len(smolagent_tools)} tools")
-        self.logger.info(f"Wrapper functions available: {list(self.wrapper_functions.keys())}")
+        self.logger.info(
+            "Converted %d/%d tools, %d errors",
+            len(smolagent_tools), len(mcp_tools), len(mcp_tools) - len(smolagent_tools)
+        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Wrapper functions available: %s", list(self.wrapper_functions.keys()))
+        
+        if smolagent_tools:
+            self._smol_tools_cache = smolagent_tools
+            self._smol_tools_cache_ts = time.monotonic()
         
         # Return the SmolAgents tools
-        return smolagent_tools
+        return list(smolagent_tools)
     
 
@@ -4,28 +4,296 @@ Tool converter module for translating MCP tools to SmolAgent tools.
 
 import inspect
 import logging
-from typing import Dict, Any, Optional, Callable, List, Type, Union, get_type_hints
+import functools
+import threading
+import weakref
+from typing import Dict, Any, Optional, Callable, List, Tuple, Type, Union, get_type_hints
 
-# Try to import SmolTool, but create a fallback if not available
-try:
-    from smolagents.tools import Tool as SmolTool
-except ImportError:
-    # Create a minimal version for testing/type checking
-    class SmolTool:
-        """Fallback implementation when smolagents is not installed."""
-        name = ""
-        description = ""
-        inputs = {}
-        output_type = "string"
+from .exceptions import ConversionError
+
+class FallbackSmolTool:
+    """Fallback implementation when smolagents is not installed."""
+    name = ""
+    description = ""
+    inputs = {}
+    output_type = "string"
+    
+    def __init__(self, **kwargs):
+        pass
+        
+    def forward(self, **kwargs):
+        pass
+        
+    def validate_arguments(self):
+        pass
+
+
+# Resolved on first use, importing smolagents is expensive
+_SmolTool = None
+
+
+def _get_smoltool() -> Type:
+    """
+    Import the SmolAgents Tool class, or the fallback if smolagents is not installed.
+    
+    Returns:
+        The SmolTool class to derive converted tools from
+    """
+    global _SmolTool
+    if _SmolTool is None:
+        try:
+            from smolagents.tools import Tool
+            _SmolTool = Tool
+        except ImportError:
+            _SmolTool = FallbackSmolTool
+    return _SmolTool
+
+
+@functools.lru_cache(maxsize=None)
+def _non_validating_subclass(base_tool: Type) -> Type:
+    """
+    Build (once per base class) a subclass of the given tool class that skips input validation.
+    
+    Args:
+        base_tool: The SmolTool class to derive from
         
-        def __init__(self, **kwargs):
+    Returns:
+        The non-validating subclass, shared by every converted tool
+    """
+    class NoValidateSmolTool(base_tool):
+        def validate_arguments(self):
+            # Skip validation
             pass
             
-        def forward(self, **kwargs):
-            pass
+    return NoValidateSmolTool
+
+
+@functools.lru_cache(maxsize=4096)
+def _schema_entry(input_type: str, description: str, nullable: bool = False) -> Dict[str, Any]:
+    """
+    Return a shared input schema entry for the given type and description.
+    
+    Tools often repeat the same parameters, so identical entries are built
+    once and shared between tools. The entries must be treated as read-only.
+    
+    Args:
+        input_type: The SmolAgent input type
+        description: The input description
+        nullable: Whether the input is optional
+        
+    Returns:
+        The input schema entry
+    """
+    entry = {'type': input_type, 'description': description}
+    if nullable:
+        entry['nullable'] = True
+    return entry
+
+
+def _signature_from_spec(param_spec) -> inspect.Signature:
+    """
+    Build a forward signature from (name, annotation, default) triples.
+    
+    Required parameters that follow one with a default become keyword-only,
+    since they can't follow it positionally.
+    
+    Args:
+        param_spec: Iterable of (name, annotation, default) triples
+        
+    Returns:
+        The signature
+    """
+    parameters = []
+    kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+    for name, annotation, default in param_spec:
+        if default is inspect.Parameter.empty and parameters \
+                and parameters[-1].default is not inspect.Parameter.empty:
+            kind = inspect.Parameter.KEYWORD_ONLY
+        parameters.append(inspect.Parameter(name, kind, default=default, annotation=annotation))
+    return inspect.Signature(parameters)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_signature(param_key: Tuple[Tuple[str, Any, type, Any], ...]) -> inspect.Signature:
+    """
+    Memoized _signature_from_spec() for hashable parameter specs.
+    
+    The key holds (name, annotation, type(default), default); the default's
+    type is part of it so that e.g. True and 1 don't share an entry.
+    """
+    return _signature_from_spec((name, annotation, default) for name, annotation, _, default in param_key)
+
+
+# Signature of the shared forward method, used by tools without inputs
+_NO_INPUTS_SIGNATURE = inspect.Signature(
+    [inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _mcp_backed_tool_class(base_tool: Type) -> Type:
+    """
+    Build (once per base class) the tool class shared by every converted MCP tool.
+    
+    Everything specific to a tool lives on the instance, so converting a tool
+    does not create a new class.
+    
+    Args:
+        base_tool: The SmolTool class to derive from
+        
+    Returns:
+        The MCP-backed tool class
+    """
+    class MCPBackedSmolTool(base_tool):
+        output_type = "string"
+        
+        def __init__(self2, name, description, inputs, output_type, original_tool,
+                     func_metadata, is_class_tool, constructor_args=None,
+                     forward_signature=None, **kwargs):
+            # Tool attributes, set before the base class validates them
+            self2.name = name
+            self2.description = description
+            self2.inputs = inputs
+            self2.output_type = output_type
+            # Store constructor args
+            self2.constructor_args = constructor_args or {}
+            # Store reference to logger
+            self2.logger = logging.getLogger(__name__)
+            # Store reference to the original tool
+            self2.original_tool = original_tool
+            self2.is_class_tool = is_class_tool
+            # Store metadata
+            self2.func_metadata = func_metadata
             
-        def validate_arguments(self):
-            pass
+            # Advertise the real parameters instead of the shared no-input signature
+            self2.positional_params = []
+            if forward_signature is not None:
+                self2.positional_params = [
+                    param.name for param in forward_signature.parameters.values()
+                    if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+                ]
+                
+                def forward(*args, **kwargs):
+                    return self2._call_original(*args, **kwargs)
+                    
+                forward.__signature__ = forward_signature
+                self2.forward = forward
+                
+            # Initialize the base class
+            super().__init__(**kwargs)
+            
+        def _parse_call_tool_result(self2, result):
+            """Parse CallToolResult objects to extract content"""
+            import json
+            from mcp.types import CallToolResult
+            
+            if not isinstance(result, CallToolResult):
+                return result
+            
+            # Check for error
+            if result.isError:
+                self2.logger.warning(f"Tool {self2.name} returned an error")
+            
+            # Extract text content from the result
+            text_contents = []
+            for item in result.content:
+                if hasattr(item, 'type') and item.type == 'text':
+                    text_contents.append(item.text)
+            
+            # If there's just one text content, parse it if it looks like JSON
+            if len(text_contents) == 1:
+                text = text_contents[0]
+                try:
+                    if text.strip().startswith('{') or text.strip().startswith('['):
+                        return json.loads(text)
+                except json.JSONDecodeError:
+                    pass
+                return text
+            
+            # Return the list of text content or empty list
+            return text_contents if text_contents else []
+            
+        def forward(self2, *args, **kwargs):
+            """Forward method that routes calls to the original tool."""
+            return self2._call_original(*args, **kwargs)
+            
+        def _call_original(self2, *args, **kwargs):
+            """
+            Route a call to the original tool.
+            Handles parameter mapping and error reporting.
+            """
+            # Map positional arguments onto the parameter names
+            if args:
+                if len(args) > len(self2.positional_params):
+                    raise TypeError(
+                        f"{self2.name} takes {len(self2.positional_params)} positional arguments "
+                        f"but {len(args)} were given"
+                    )
+                kwargs.update(zip(self2.positional_params, args))
+                
+            try:
+                # Set default values for optional parameters if not provided
+                for param, default in self2.func_metadata['optional_params'].items():
+                    if param not in kwargs:
+                        kwargs[param] = default
+                
+                # Call the appropriate function based on tool type
+                result = None
+                if self2.is_class_tool:
+                    # For class-based tools, instantiate and call forward
+                    if isinstance(self2.original_tool, type):
+                        # If it's a class, instantiate it
+                        instance = self2.original_tool(**self2.constructor_args)
+                        result = instance.forward(**kwargs)
+                    else:
+                        # If it's already an instance, call forward
+                        result = self2.original_tool.forward(**kwargs)
+                else:
+                    # For function-based tools, call directly
+                    result = self2.original_tool(**kwargs)
+                
+                # Parse the result before returning
+                return self2._parse_call_tool_result(result)
+                
+            except TypeError as e:
+                # Handle parameter mismatches
+                error_msg = str(e)
+                self2.logger.error(f"Error calling {self2.name}: {error_msg}")
+                
+                # Attempt to fix parameter name mismatches
+                if "got an unexpected keyword argument" in error_msg:
+                    # Extract the problematic parameter name
+                    param_name = error_msg.split("'")[1] if "'" in error_msg else None
+                    if param_name and param_name in kwargs:
+                        # Try common variations (snake_case vs camelCase)
+                        variations = [
+                            param_name.lower(),  # all lowercase
+                            param_name.replace('_', ''),  # remove underscores
+                            ''.join(w.capitalize() if i > 0 else w.lower() 
+                                   for i, w in enumerate(param_name.split('_')))  # camelCase
+                        ]
+                        
+                        # Check if any variation matches expected params
+                        for expected in self2.func_metadata['params']:
+                            expected_lower = expected.lower()
+                            if expected_lower in variations or any(v == expected_lower for v in variations):
+                                self2.logger.warning(f"Parameter mismatch: mapping '{param_name}' to '{expected}'")
+                                kwargs[expected] = kwargs.pop(param_name)
+                                return self2._call_original(**kwargs)  # Try again with fixed parameter
+                
+                # Re-raise the exception if we couldn't fix it
+                raise
+                
+    # The shared forward is used as is by tools without inputs
+    MCPBackedSmolTool.forward.__signature__ = _NO_INPUTS_SIGNATURE
+    
+    return MCPBackedSmolTool
+
+
+# Per-tool cache of (inputs object, function metadata, SmolAgent inputs)
+_schema_cache: "weakref.WeakKeyDictionary[Any, tuple]" = weakref.WeakKeyDictionary()
+_schema_cache_lock = threading.Lock()
+
 
 class MCPToSmolToolConverter:
     """
@@ -46,6 +314,43 @@ class MCPToSmolToolConverter:
     # Common params to filter out
     FILTERED_PARAMS = ['self', 'self_or_none', 'kwargs', 'args']
     
+    # Input definitions made only of these keys are shared between tools
+    INTERNED_KEYS = {'type', 'description', 'nullable'}
+    
+    # Direct lookup for type names, the usual case for JSON-sourced MCP schemas
+    STR_TYPE_MAP = {
+        'string': 'string', 'str': 'string',
+        'boolean': 'boolean', 'bool': 'boolean',
+        'integer': 'integer', 'int': 'integer',
+        'number': 'number', 'float': 'number',
+        'array': 'array', 'list': 'array',
+        'object': 'object', 'dict': 'object',
+        'any': 'any',
+        'null': 'null', 'None': 'null',
+    }
+    
+    # Direct lookup for Python type hints
+    TYPE_MAP = {
+        str: 'string',
+        bool: 'boolean',
+        int: 'integer',
+        float: 'number',
+        list: 'array',
+        dict: 'object',
+        Any: 'any',
+        None: 'null', type(None): 'null',
+    }
+    
+    # Python annotations used in synthesized forward signatures
+    TYPE_ANNOTATIONS = {
+        'string': str,
+        'boolean': bool,
+        'integer': int,
+        'number': float,
+        'array': list,
+        'object': dict,
+    }
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize the converter.
@@ -57,23 +362,13 @@ class MCPToSmolToolConverter:
         self.logger = logger or logging.getLogger(__name__)
         
         # Store SmolTool class reference 
-        try:
-            from smolagents.tools import Tool as ImportedSmolTool
-            self.SmolTool = ImportedSmolTool
-        except ImportError:
+        self.SmolTool = _get_smoltool()
+        if self.SmolTool is FallbackSmolTool:
             self.logger.warning("smolagents.tools.Tool not found, using fallback implementation")
-            self.SmolTool = SmolTool
     
     def create_non_validating_tool(self) -> Type:
-        """Create a subclass of SmolTool that skips input validation."""
-        BaseTool = self.SmolTool
-        
-        class NoValidateSmolTool(BaseTool):
-            def validate_arguments(self):
-                # Skip validation
-                pass
-                
-        return NoValidateSmolTool
+        """Return the subclass of SmolTool that skips input validation."""
+        return _non_validating_subclass(self.SmolTool)
     
     def _extract_function_metadata(self, func_or_method: Callable) -> Dict[str, Any]:
         """
@@ -119,10 +414,12 @@ class MCPToSmolToolConverter:
                     if name in metadata['params'] and name not in metadata['type_hints']:
                         metadata['type_hints'][name] = hint
             except Exception:
+                # Annotations are evaluated with eval(), so a bad string hint
+                # can raise anything (SyntaxError, NameError, ...); ignore it
                 pass
                 
-        except Exception as e:
-            self.logger.warning(f"Error extracting function metadata: {e}")
+        except (ValueError, TypeError) as e:
+            self.logger.warning("Error extracting function metadata: %s", e)
             
         return metadata
     
@@ -136,7 +433,17 @@ class MCPToSmolToolConverter:
         Returns:
             SmolAgent compatible type string
         """
-        # First handle common Python types
+        # First handle type names and common Python types
+        if isinstance(type_hint, str):
+            if type_hint in self.STR_TYPE_MAP:
+                return self.STR_TYPE_MAP[type_hint]
+        else:
+            try:
+                return self.TYPE_MAP[type_hint]
+            except (KeyError, TypeError):
+                # Unknown or unhashable hint, fall back to matching its string form
+                pass
+            
         type_str = str(type_hint)
         
         if type_str == "<class 'str'>" or "str" in type_str:
@@ -163,17 +470,19 @@ class MCPToSmolToolConverter:
             # Default to 'any' for unknown types
             return "any"
     
-    def _normalize_inputs_dict(self, inputs_dict: Dict) -> Dict:
+    def _normalize_inputs_dict(self, inputs_dict: Dict, nullable_params: Optional[Dict] = None) -> Dict:
         """
         Normalize an inputs dictionary to ensure all types are valid SmolAgent types.
         
         Args:
             inputs_dict: Raw inputs dictionary
+            nullable_params: Parameters to mark as nullable
             
         Returns:
             Normalized inputs dictionary
         """
         normalized = {}
+        nullable_params = nullable_params or {}
         
         for key, value in inputs_dict.items():
             # Skip filtered parameters
@@ -181,17 +490,28 @@ class MCPToSmolToolConverter:
                 continue
                 
             if isinstance(value, dict):
+                input_type = value.get('type')
+                
+                # Convert to valid SmolAgent type if needed
+                if 'type' in value and not (isinstance(input_type, str) and input_type in self.VALID_TYPES):
+                    input_type = self._normalize_input_type(input_type)
+                    
+                nullable = bool(value.get('nullable')) or key in nullable_params
+                description = value.get('description')
+                
+                # Plain type/description entries are shared between tools
+                if value.keys() <= self.INTERNED_KEYS and isinstance(input_type, str) \
+                        and isinstance(description, str):
+                    normalized[key] = _schema_entry(input_type, description, nullable)
+                    continue
+                    
                 # Clone the dict so we don't modify the original
                 normalized_value = value.copy()
-                
-                # Ensure the input has a type and it's valid
                 if 'type' in normalized_value:
-                    input_type = normalized_value['type']
+                    normalized_value['type'] = input_type
+                if nullable:
+                    normalized_value['nullable'] = True
                     
-                    # Convert to valid SmolAgent type if needed
-                    if input_type not in self.VALID_TYPES:
-                        normalized_value['type'] = self._normalize_input_type(input_type)
-                        
                 normalized[key] = normalized_value
         
         return normalized
@@ -209,37 +529,103 @@ class MCPToSmolToolConverter:
         """
         # First check if the tool already has an inputs dict
         if hasattr(tool, 'inputs') and isinstance(tool.inputs, dict):
-            # Normalize the existing inputs dict
-            inputs = self._normalize_inputs_dict(tool.inputs)
-            
-            # Check for optional parameters and mark them as nullable
-            for param in metadata['optional_params']:
-                if param in inputs:
-                    inputs[param]['nullable'] = True
-                    
-            return inputs
+            # Normalize the existing inputs dict, marking optional parameters as nullable
+            return self._normalize_inputs_dict(tool.inputs, metadata['optional_params'])
         
         # Otherwise create a new inputs dict from the function metadata
         inputs = {}
         
         for param in metadata['params']:
-            input_def = {
-                'description': f"Parameter: {param}",
-                'type': 'any'
-            }
+            input_type = 'any'
             
             # Add type information if available
             if param in metadata['type_hints']:
-                input_def['type'] = self._normalize_input_type(metadata['type_hints'][param])
+                input_type = self._normalize_input_type(metadata['type_hints'][param])
                 
             # Mark optional parameters as nullable
-            if param in metadata['optional_params']:
-                input_def['nullable'] = True
-                
-            inputs[param] = input_def
+            inputs[param] = _schema_entry(
+                input_type, f"Parameter: {param}", param in metadata['optional_params']
+            )
             
         return inputs
     
+    def _build_forward_signature(self, inputs: Dict, optional_params: Dict) -> Optional[inspect.Signature]:
+        """
+        Synthesize a forward() signature matching the tool inputs.
+        
+        SmolAgents inspects the forward signature to validate a tool, so the
+        generic forward(*args, **kwargs) wrapper advertises the real parameters
+        here. The signature describes the bound forward, without self.
+        Nullable inputs get a default, and required inputs that follow one
+        become keyword-only to keep the signature valid.
+        
+        Args:
+            inputs: The SmolAgent inputs dictionary
+            optional_params: Default values of the optional parameters
+            
+        Returns:
+            The signature, or None if an input name is not a valid identifier
+        """
+        param_spec = []
+        for name, input_def in inputs.items():
+            default = inspect.Parameter.empty
+            if name in optional_params:
+                default = optional_params[name]
+            elif input_def.get('nullable'):
+                default = None
+                
+            input_type = input_def.get('type')
+            annotation = self.TYPE_ANNOTATIONS.get(input_type, Any) if isinstance(input_type, str) else Any
+            param_spec.append((name, annotation, default))
+            
+        try:
+            try:
+                # Tools with the same parameters share one Signature object
+                return _cached_signature(tuple(
+                    (name, annotation, type(default), default) for name, annotation, default in param_spec
+                ))
+            except TypeError:
+                # Unhashable default value, build it without the cache
+                return _signature_from_spec(param_spec)
+        except (ValueError, TypeError) as e:
+            self.logger.warning("Cannot build a forward signature from inputs %s: %s", list(inputs), e)
+            return None
+    
+    def _build_metadata_and_inputs(self, mcp_tool, is_class_tool: bool, tool_name: str,
+                                   constructor_args: Optional[Dict]) -> Tuple[Dict, Dict]:
+        """
+        Extract the function metadata and the SmolAgent inputs dictionary of a tool.
+        
+        Args:
+            mcp_tool: The MCP tool (function or object)
+            is_class_tool: Whether the tool exposes a forward method
+            tool_name: The tool name, used in log messages
+            constructor_args: Constructor arguments for class-based tools
+            
+        Returns:
+            Tuple of (function metadata, inputs dictionary)
+        """
+        # Extract function metadata
+        if is_class_tool:
+            # For class-based tools, inspect the forward method
+            func_metadata = self._extract_function_metadata(mcp_tool.forward)
+            # Also check constructor parameters
+            if constructor_args is None:
+                try:
+                    init_sig = inspect.signature(mcp_tool.__init__)
+                    for param_name, param in init_sig.parameters.items():
+                        if param_name not in self.FILTERED_PARAMS and param.default is inspect.Parameter.empty:
+                            self.logger.warning(f"Tool {tool_name} requires constructor parameter: {param_name}")
+                except (ValueError, TypeError):
+                    pass
+        else:
+            # For function-based tools, inspect the function itself
+            func_metadata = self._extract_function_metadata(mcp_tool)
+        
+        # Create inputs dictionary
+        tool_inputs = self._create_inputs_dict(mcp_tool, func_metadata)
+        return func_metadata, tool_inputs
+    
     def convert(self, mcp_tool: Union[Callable, Any], 
                 skip_validation: bool = False, 
                 constructor_args: Optional[Dict] = None) -> Any:
@@ -253,6 +639,10 @@ class MCPToSmolToolConverter:
             
         Returns:
             A SmolAgent Tool instance
+            
+        Raises:
+            ValueError: If the tool has no name or description
+            ConversionError: If SmolAgents rejects the converted tool
         """
         # Ensure we have the necessary attributes
         if not hasattr(mcp_tool, 'name') or not hasattr(mcp_tool, 'description'):
@@ -264,150 +654,74 @@ class MCPToSmolToolConverter:
         # Determine if this is a class-based tool or a function-based tool
         is_class_tool = hasattr(mcp_tool, 'forward') and callable(mcp_tool.forward)
         
-        # Extract function metadata
-        if is_class_tool:
-            # For class-based tools, inspect the forward method
-            func_metadata = self._extract_function_metadata(mcp_tool.forward)
-            # Also check constructor parameters
-            if constructor_args is None:
-                constructor_args = {}
+        # Reuse the metadata and inputs computed for this tool, unless its inputs were replaced
+        raw_inputs = getattr(mcp_tool, 'inputs', None)
+        with _schema_cache_lock:
+            try:
+                cached = _schema_cache.get(mcp_tool)
+            except TypeError:
+                # Not weak-referenceable, can't be cached
+                cached = None
+        
+        if cached is not None and cached[0] is raw_inputs:
+            _, func_metadata, tool_inputs = cached
+            tool_inputs = dict(tool_inputs)
+        else:
+            func_metadata, tool_inputs = self._build_metadata_and_inputs(
+                mcp_tool, is_class_tool, tool_name, constructor_args
+            )
+            with _schema_cache_lock:
                 try:
-                    init_sig = inspect.signature(mcp_tool.__init__)
-                    for param_name, param in init_sig.parameters.items():
-                        if param_name not in self.FILTERED_PARAMS and param.default is inspect.Parameter.empty:
-                            self.logger.warning(f"Tool {tool_name} requires constructor parameter: {param_name}")
-                except Exception:
+                    _schema_cache[mcp_tool] = (raw_inputs, func_metadata, dict(tool_inputs))
+                except TypeError:
                     pass
-        else:
-            # For function-based tools, inspect the function itself
-            func_metadata = self._extract_function_metadata(mcp_tool)
         
-        # Create inputs dictionary
-        tool_inputs = self._create_inputs_dict(mcp_tool, func_metadata)
+        if is_class_tool and constructor_args is None:
+            constructor_args = {}
         
         # Get output type
         tool_output_type = getattr(mcp_tool, 'output_type', 'string')
         
+        # Synthesize the forward signature from the inputs; tools without
+        # inputs use the shared class-level forward as is
+        forward_signature = None
+        if tool_inputs:
+            forward_signature = self._build_forward_signature(tool_inputs, func_metadata['optional_params'])
+        
         # Choose the base class based on validation needs
         BaseTool = self.create_non_validating_tool() if skip_validation else self.SmolTool
-        
-        # Create the wrapper class using a factory function 
-        # to properly capture the variables from this scope
-        def create_tool_class():
-            class DynamicMCPToolWrapper(BaseTool):
-                name = tool_name
-                description = tool_description 
-                inputs = tool_inputs
-                output_type = tool_output_type
-                
-                def __init__(self2, **kwargs):
-                    # Initialize the base class
-                    super().__init__(**kwargs)
-                    # Store constructor args
-                    self2.constructor_args = constructor_args or {}
-                    # Store reference to logger
-                    self2.logger = logging.getLogger(__name__)
-                    # Store reference to the original tool
-                    self2.original_tool = mcp_tool
-                    # Store metadata
-                    self2.func_metadata = func_metadata
-                    
-                def _parse_call_tool_result(self2, result):
-                    """Parse CallToolResult objects to extract content"""
-                    import json
-                    from mcp.types import CallToolResult
-                    
-                    if not isinstance(result, CallToolResult):
-                        return result
-                    
-                    # Check for error
-                    if result.isError:
-                        self2.logger.warning(f"Tool {self2.name} returned an error")
-                    
-                    # Extract text content from the result
-                    text_contents = []
-                    for item in result.content:
-                        if hasattr(item, 'type') and item.type == 'text':
-                            text_contents.append(item.text)
-                    
-                    # If there's just one text content, parse it if it looks like JSON
-                    if len(text_contents) == 1:
-                        text = text_contents[0]
-                        try:
-                            if text.strip().startswith('{') or text.strip().startswith('['):
-                                return json.loads(text)
-                        except json.JSONDecodeError:
-                            pass
-                        return text
-                    
-                    # Return the list of text content or empty list
-                    return text_contents if text_contents else []
-                    
-                def forward(self2, **kwargs):
-                    """
-                    Forward method that routes calls to the original tool.
-                    Handles parameter mapping and error reporting.
-                    """
-                    try:
-                        # Set default values for optional parameters if not provided
-                        for param, default in self2.func_metadata['optional_params'].items():
-                            if param not in kwargs:
-                                kwargs[param] = default
-                        
-                        # Call the appropriate function based on tool type
-                        result = None
-                        if is_class_tool:
-                            # For class-based tools, instantiate and call forward
-                            if isinstance(self2.original_tool, type):
-                                # If it's a class, instantiate it
-                                instance = self2.original_tool(**self2.constructor_args)
-                                result = instance.forward(**kwargs)
-                            else:
-                                # If it's already an instance, call forward
-                                result = self2.original_tool.forward(**kwargs)
-                        else:
-                            # For function-based tools, call directly
-                            result = self2.original_tool(**kwargs)
-                        
-                        # Parse the result before returning
-                        return self2._parse_call_tool_result(result)
-                        
-                    except TypeError as e:
-                        # Handle parameter mismatches
-                        error_msg = str(e)
-                        self2.logger.error(f"Error calling {tool_name}: {error_msg}")
-                        
-                        # Attempt to fix parameter name mismatches
-                        if "got an unexpected keyword argument" in error_msg:
-                            # Extract the problematic parameter name
-                            param_name = error_msg.split("'")[1] if "'" in error_msg else None
-                            if param_name and param_name in kwargs:
-                                # Try common variations (snake_case vs camelCase)
-                                variations = [
-                                    param_name.lower(),  # all lowercase
-                                    param_name.replace('_', ''),  # remove underscores
-                                    ''.join(w.capitalize() if i > 0 else w.lower() 
-                                           for i, w in enumerate(param_name.split('_')))  # camelCase
-                                ]
-                                
-                                # Check if any variation matches expected params
-                                for expected in self2.func_metadata['params']:
-                                    expected_lower = expected.lower()
-                                    if expected_lower in variations or any(v == expected_lower for v in variations):
-                                        self2.logger.warning(f"Parameter mismatch: mapping '{param_name}' to '{expected}'")
-                                        kwargs[expected] = kwargs.pop(param_name)
-                                        return self2.forward(**kwargs)  # Try again with fixed parameter
-                        
-                        # Re-raise the exception if we couldn't fix it
-                        raise
-                        
-            return DynamicMCPToolWrapper
-            
-        # Create the wrapper class
-        ToolClass = create_tool_class()
+        ToolClass = _mcp_backed_tool_class(BaseTool)
         
         # Create and return an instance
-        return ToolClass()
+        try:
+            tool_instance = ToolClass(
+                name=tool_name,
+                description=tool_description,
+                inputs=tool_inputs,
+                output_type=tool_output_type,
+                original_tool=mcp_tool,
+                func_metadata=func_metadata,
+                is_class_tool=is_class_tool,
+                constructor_args=constructor_args,
+                forward_signature=forward_signature,
+            )
+        except Exception as e:
+            # SmolAgents validation raises bare Exceptions, e.g. for an invalid
+            # tool name or a forward signature that doesn't match the inputs
+            raise ConversionError(f"Invalid SmolAgents tool {tool_name!r}: {e}") from e
+        if self.logger.isEnabledFor(logging.DEBUG):
+            forward_sig = inspect.signature(tool_instance.forward)
+            self.logger.debug(
+                "Created SmolAgents tool: %s inputs=%s sig=%s skip_validation=%s",
+                tool_name, tool_instance.inputs, forward_sig, skip_validation,
+                extra={
+                    "tool_name": tool_name,
+                    "tool_inputs": tool_instance.inputs,
+                    "tool_signature": str(forward_sig),
+                    "skip_validation": skip_validation,
+                }
+            )
+        return tool_instance
 
 
 def convert_mcp_to_smol(
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+import mcp_agent_tools
+from mcp_agent_tools import exceptions
+from mcp_agent_tools.smol_mcp_tool_factory import SmolMCPToolFactory
+
+
+def test_import_does_not_load_submodules():
+    code = (
+        "import sys, mcp_agent_tools; "
+        "print(any(m.startswith('mcp_agent_tools.') for m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("name", mcp_agent_tools.__all__)
+def test_exports_resolve(name):
+    module_name, attr = mcp_agent_tools._EXPORTS[name]
+    
+    assert getattr(mcp_agent_tools, name) is getattr(sys.modules[f"mcp_agent_tools{module_name}"], attr)
+
+
+def test_exports_are_the_submodule_objects():
+    assert mcp_agent_tools.SmolMCPToolFactory is SmolMCPToolFactory
+    assert mcp_agent_tools.ConversionError is exceptions.ConversionError
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        mcp_agent_tools.NotAnExport
+
+
+def test_dir_lists_exports():
+    assert set(mcp_agent_tools.__all__) <= set(dir(mcp_agent_tools))
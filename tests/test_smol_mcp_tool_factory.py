@@ -0,0 +1,642 @@
+import contextlib
+import gc
+import json
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+import mcp_agent_tools.smol_mcp_tool_factory as factory_module
+from mcp_agent_tools.smol_mcp_tool_factory import SmolMCPToolFactory
+
+
+class StubService:
+    """Stands in for MCPToolService without spawning a server."""
+    
+    created = []
+    start_delay = 0.0
+    start_result = True
+    
+    def __init__(self, server_url=None, command=None, args=None, env=None,
+                 sampling_callback=None, logger=None):
+        self.server_url = server_url
+        self.command = command
+        self.args = args or []
+        self.env = env or {}
+        self.logger = logger
+        self.running = False
+        self.connected = False
+        self.stopped = 0
+        self.tools = []
+        self.get_tools_calls = 0
+        StubService.created.append(self)
+        
+    def start(self):
+        time.sleep(StubService.start_delay)
+        self.running = True
+        self.connected = StubService.start_result
+        return self.connected
+        
+    def stop(self):
+        self.stopped += 1
+        self.running = False
+        self.connected = False
+        
+    def get_tools(self):
+        self.get_tools_calls += 1
+        if not self.connected:
+            raise RuntimeError("Not connected to MCP server")
+        return list(self.tools)
+
+
+@pytest.fixture(autouse=True)
+def stub_service(monkeypatch):
+    StubService.created = []
+    StubService.start_delay = 0.0
+    StubService.start_result = True
+    monkeypatch.setattr(factory_module, "MCPToolService", StubService)
+    yield StubService
+    factory_module._SERVICE_POOL.clear()
+
+
+def make_factory(server_url="http://localhost:8000/sse", **kwargs):
+    kwargs.setdefault("cache_dir", None)
+    return SmolMCPToolFactory(server_url=server_url, **kwargs)
+
+
+def test_factories_for_same_server_share_service():
+    a = make_factory()
+    b = make_factory()
+    c = make_factory(server_url="http://localhost:9000/sse")
+    
+    assert a.service is b.service
+    assert c.service is not a.service
+    assert len(StubService.created) == 2
+    assert not a.own_service
+
+
+def test_pooled_service_uses_creating_factory_logger():
+    logger = logging.getLogger("test.pooled")
+    factory = make_factory(logger=logger)
+    
+    assert factory.service.logger is logger
+
+
+def test_share_service_false_creates_own_service():
+    a = make_factory()
+    b = make_factory(share_service=False)
+    
+    assert b.service is not a.service
+    assert b.own_service
+    b.close()
+    assert b.service.stopped == 1
+    assert a.service.stopped == 0
+
+
+def test_pooled_service_stopped_when_last_factory_closes():
+    a = make_factory()
+    b = make_factory()
+    service = a.service
+    
+    a.close()
+    assert service.stopped == 0
+    b.close()
+    assert service.stopped == 1
+    assert not factory_module._SERVICE_POOL
+
+
+def test_double_close_releases_once():
+    a = make_factory()
+    b = make_factory()
+    
+    a.close()
+    a.close()
+    assert b.service.stopped == 0
+    assert b.service.running
+
+
+def test_garbage_collected_factory_releases_service():
+    a = make_factory()
+    b = make_factory()
+    service = a.service
+    
+    del a
+    gc.collect()
+    assert service.stopped == 0
+    del b
+    gc.collect()
+    assert service.stopped == 1
+
+
+def test_context_manager_closes_factory():
+    with make_factory() as factory:
+        service = factory.service
+    assert service.stopped == 1
+
+
+def test_dead_pooled_service_is_replaced():
+    a = make_factory()
+    a.service.running = False
+    a.service.connected = False
+    
+    b = make_factory()
+    assert b.service is not a.service
+    assert b.service.running
+    
+    # Releasing the replaced service must not touch the new one
+    a.close()
+    assert b.service.stopped == 0
+
+
+def test_failed_start_is_not_pooled():
+    StubService.start_result = False
+    a = make_factory()
+    assert a.own_service
+    assert not factory_module._SERVICE_POOL
+    
+    StubService.start_result = True
+    b = make_factory()
+    assert b.service is not a.service
+    assert b.started
+
+
+def test_concurrent_factories_start_one_service():
+    StubService.start_delay = 0.2
+    factories = []
+    barrier = threading.Barrier(4)
+    
+    def create():
+        barrier.wait()
+        factories.append(make_factory())
+        
+    threads = [threading.Thread(target=create) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+        
+    assert len(StubService.created) == 1
+    assert len({id(f.service) for f in factories}) == 1
+    
+    for f in factories:
+        f.close()
+    assert StubService.created[0].stopped == 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(factory_module.time, "monotonic", fake)
+    return fake
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=3, cooldown=30.0)
+    
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.is_open()
+    breaker.record_failure()
+    assert breaker.is_open()
+
+
+def test_breaker_success_resets_failure_count(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=3, cooldown=30.0)
+    
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open()
+
+
+def test_breaker_stays_open_during_cooldown(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=1, cooldown=30.0)
+    breaker.record_failure()
+    
+    clock.now += 29.0
+    assert breaker.is_open()
+
+
+def test_breaker_half_open_allows_single_trial(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=1, cooldown=30.0)
+    breaker.record_failure()
+    clock.now += 30.0
+    
+    assert not breaker.is_open()
+    assert breaker.state == "half_open"
+    # Other callers are rejected while the trial is in flight
+    assert breaker.is_open()
+    assert breaker.is_open()
+
+
+def test_breaker_half_open_success_closes(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=1, cooldown=30.0)
+    breaker.record_failure()
+    clock.now += 30.0
+    
+    assert not breaker.is_open()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert not breaker.is_open()
+    assert not breaker.is_open()
+
+
+def test_breaker_half_open_failure_reopens(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=3, cooldown=30.0)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 30.0
+    
+    assert not breaker.is_open()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.is_open()
+    clock.now += 30.0
+    assert not breaker.is_open()
+
+
+def test_breaker_abandoned_trial_expires(clock):
+    breaker = factory_module._CircuitBreaker(fail_threshold=1, cooldown=30.0)
+    breaker.record_failure()
+    clock.now += 30.0
+    assert not breaker.is_open()
+    
+    clock.now += 30.0
+    assert not breaker.is_open()
+    assert breaker.is_open()
+
+
+def test_get_tools_fails_fast_while_breaker_open(clock):
+    factory = make_factory()
+    factory.service.connected = False
+    calls = factory.service.get_tools_calls
+    
+    for _ in range(3):
+        with pytest.raises(factory_module.ServiceError):
+            factory._get_tools()
+    assert factory.service.get_tools_calls == calls + 3
+    
+    with pytest.raises(factory_module.ServiceError):
+        factory._get_tools()
+    assert factory.service.get_tools_calls == calls + 3
+    
+    # After the cooldown a trial call reaches the service and closes the breaker
+    clock.now += 30.0
+    factory.service.connected = True
+    factory.service.tools = [lambda: None]
+    assert factory._get_tools() == factory.service.tools
+    assert factory._breaker.state == "closed"
+
+
+class FakeCatalogTool:
+    def __init__(self, name):
+        self.name = name
+        self.description = f"{name} tool"
+        self.inputs = {"message": {"type": "string", "description": "Message"}}
+        self.output_type = "string"
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    """Replace ToolCollection.from_mcp with a fake server catalog."""
+    smol_tools = pytest.importorskip("smolagents.tools")
+    
+    class FakeCollection:
+        tools = [FakeCatalogTool("echo")]
+        fetches = 0
+        
+    @contextlib.contextmanager
+    def from_mcp(*args, **kwargs):
+        FakeCollection.fetches += 1
+        yield FakeCollection
+        
+    monkeypatch.setattr(smol_tools.ToolCollection, "from_mcp", staticmethod(from_mcp))
+    return FakeCollection
+
+
+def test_get_tools_reports_lost_connection():
+    factory = make_factory()
+    factory.service.tools = [lambda: None]
+    assert factory._get_tools() == factory.service.tools
+    
+    factory.service.connected = False
+    with pytest.raises(factory_module.ServiceError):
+        factory._get_tools()
+    assert factory._breaker.fail_count == 1
+
+
+def test_tool_info_cached_until_ttl_expires(clock, catalog):
+    factory = make_factory(cache_ttl_seconds=60.0)
+    
+    assert factory._get_tool_info_list()[0]["name"] == "echo"
+    factory._get_tool_info_list()
+    assert catalog.fetches == 1
+    
+    clock.now += 60.0
+    factory._get_tool_info_list()
+    assert catalog.fetches == 2
+
+
+def test_empty_tool_info_not_cached(tmp_path, catalog):
+    catalog.tools = []
+    factory = make_factory(cache_dir=str(tmp_path))
+    
+    assert factory._get_tool_info_list() == []
+    assert list(tmp_path.iterdir()) == []
+    
+    catalog.tools = [FakeCatalogTool("echo")]
+    assert factory._get_tool_info_list()[0]["name"] == "echo"
+    assert catalog.fetches == 2
+
+
+def test_tool_info_persisted_and_loaded_from_disk(tmp_path, catalog):
+    first = make_factory(cache_dir=str(tmp_path), share_service=False)
+    first._get_tool_info_list()
+    cache_path = first._cache_path()
+    with open(cache_path, encoding="utf-8") as fh:
+        assert json.load(fh)["tools"][0]["name"] == "echo"
+        
+    second = make_factory(cache_dir=str(tmp_path), share_service=False)
+    assert second._cache_path() == cache_path
+    assert second._get_tool_info_list()[0]["name"] == "echo"
+    assert catalog.fetches == 1
+
+
+def test_expired_disk_cache_is_ignored(tmp_path, catalog):
+    factory = make_factory(cache_dir=str(tmp_path), cache_ttl_seconds=60.0)
+    with open(factory._cache_path(), "w", encoding="utf-8") as fh:
+        json.dump({"created": time.time() - 120.0, "tools": [{"name": "stale", "inputs": {}}]}, fh)
+        
+    assert factory._get_tool_info_list()[0]["name"] == "echo"
+    assert catalog.fetches == 1
+
+
+def test_unreadable_disk_cache_is_ignored(tmp_path, catalog):
+    factory = make_factory(cache_dir=str(tmp_path))
+    with open(factory._cache_path(), "w", encoding="utf-8") as fh:
+        fh.write("{not json")
+        
+    assert factory._get_tool_info_list()[0]["name"] == "echo"
+    assert catalog.fetches == 1
+
+
+@pytest.mark.parametrize("data", [
+    {"created": "yesterday", "tools": [{"name": "stale", "inputs": {}}]},
+    {"created": True, "tools": [{"name": "stale", "inputs": {}}]},
+    {"tools": [{"name": "stale", "inputs": {}}]},
+    {"created": 0, "tools": "stale"},
+    {"created": 0, "tools": ["stale"]},
+    {"created": 0, "tools": [{"description": "no name"}]},
+    ["stale"],
+])
+def test_malformed_disk_cache_is_ignored(tmp_path, catalog, data):
+    if isinstance(data, dict) and data.get("created") == 0:
+        data["created"] = time.time()
+    factory = make_factory(cache_dir=str(tmp_path))
+    with open(factory._cache_path(), "w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+        
+    assert factory._get_tool_info_list()[0]["name"] == "echo"
+    assert catalog.fetches == 1
+
+
+def test_cache_dir_none_disables_persistence(catalog):
+    factory = make_factory(cache_dir=None)
+    
+    assert factory._cache_path() is None
+    factory._get_tool_info_list()
+    assert catalog.fetches == 1
+
+
+def test_invalidate_cache_clears_memory_and_disk(tmp_path, catalog):
+    factory = make_factory(cache_dir=str(tmp_path))
+    factory.service.tools = [lambda: None]
+    factory._get_tools()
+    factory._get_tool_info_list()
+    assert os.path.exists(factory._cache_path())
+    
+    factory.invalidate_cache()
+    assert factory._tool_info_cache is None
+    assert not os.path.exists(factory._cache_path())
+    
+    factory._get_tool_info_list()
+    assert catalog.fetches == 2
+
+
+def test_create_many_starts_every_service():
+    factories = SmolMCPToolFactory.create_many(
+        [{"server_url": "http://localhost:8000/sse"}, {"server_url": "http://localhost:9000/sse"}],
+        cache_dir=None
+    )
+    
+    assert [f.service.server_url for f in factories] == ["http://localhost:8000/sse", "http://localhost:9000/sse"]
+    assert all(f.service.running and f.own_service for f in factories)
+    for f in factories:
+        f.close()
+    assert all(s.stopped for s in StubService.created)
+
+
+@pytest.mark.parametrize("reserved", ["service", "own_service"])
+def test_create_many_rejects_reserved_kwargs(reserved):
+    with pytest.raises(ValueError, match=reserved):
+        SmolMCPToolFactory.create_many([{"server_url": "http://localhost:8000/sse"}], **{reserved: None})
+    assert not StubService.created
+
+
+def test_create_many_stops_services_when_a_factory_fails(monkeypatch):
+    def fail(self, *args, **kwargs):
+        raise RuntimeError("boom")
+        
+    monkeypatch.setattr(SmolMCPToolFactory, "__init__", fail)
+    with pytest.raises(RuntimeError):
+        SmolMCPToolFactory.create_many(
+            [{"server_url": "http://localhost:8000/sse"}, {"server_url": "http://localhost:9000/sse"}]
+        )
+        
+    assert len(StubService.created) == 2
+    assert all(s.stopped == 1 and not s.running for s in StubService.created)
+
+
+def test_create_many_stops_services_when_a_start_fails(monkeypatch):
+    start = StubService.start
+    
+    def start_or_fail(self):
+        start(self)
+        if self.server_url.endswith(":9000/sse"):
+            raise OSError("connection refused")
+        return True
+        
+    monkeypatch.setattr(StubService, "start", start_or_fail)
+    with pytest.raises(OSError):
+        SmolMCPToolFactory.create_many(
+            [{"server_url": "http://localhost:8000/sse"}, {"server_url": "http://localhost:9000/sse"}]
+        )
+        
+    assert all(not s.running for s in StubService.created)
+
+
+def test_own_service_read_at_close_time():
+    service = StubService()
+    service.start()
+    
+    factory = SmolMCPToolFactory.from_service(service, own_service=True)
+    factory.own_service = False
+    factory.close()
+    assert service.stopped == 0
+    
+    factory = SmolMCPToolFactory.from_service(service)
+    factory.own_service = True
+    del factory
+    gc.collect()
+    assert service.stopped == 1
+
+
+def make_mcp_tool(name):
+    """Build a callable with the metadata MCPToolService attaches to its tools."""
+    def tool(message=None):
+        return f"{name}: {message}"
+        
+    tool.name = name
+    tool.description = f"{name} tool"
+    return tool
+
+
+def test_prewarm_fills_tool_cache(catalog):
+    factory = make_factory(prewarm=True)
+    factory.service.tools = [make_mcp_tool("echo")]
+    factory.prewarm()
+    factory._prewarm_thread.join(5.0)
+    
+    assert [tool.name for tool in factory._smol_tools_cache] == ["echo"]
+    assert [tool.name for tool in factory.get_smolagent_tools()] == ["echo"]
+    assert catalog.fetches == 1
+
+
+def test_get_smolagent_tools_waits_for_running_prewarm(catalog, monkeypatch):
+    factory = make_factory()
+    factory.service.tools = [make_mcp_tool("echo")]
+    release = threading.Event()
+    get_tools = factory.service.get_tools
+    
+    def slow_get_tools():
+        release.wait(5.0)
+        return get_tools()
+        
+    monkeypatch.setattr(factory.service, "get_tools", slow_get_tools)
+    calls = factory.service.get_tools_calls
+    factory.prewarm()
+    threading.Timer(0.1, release.set).start()
+    
+    assert [tool.name for tool in factory.get_smolagent_tools()] == ["echo"]
+    # The call reused the prewarm result instead of converting again
+    assert factory.service.get_tools_calls == calls + 1
+    assert catalog.fetches == 1
+
+
+def test_prewarm_timeout_falls_back_to_synchronous_build(catalog, monkeypatch):
+    factory = make_factory(prewarm_timeout=0.05)
+    factory.service.tools = [make_mcp_tool("echo")]
+    entered = threading.Event()
+    release = threading.Event()
+    get_tools = factory.service.get_tools
+    calls = factory.service.get_tools_calls
+    
+    def stuck_first_call():
+        if factory.service.get_tools_calls == calls:
+            factory.service.get_tools_calls += 1
+            entered.set()
+            release.wait(5.0)
+            return []
+        return get_tools()
+        
+    monkeypatch.setattr(factory.service, "get_tools", stuck_first_call)
+    factory.prewarm()
+    assert entered.wait(5.0)
+    try:
+        # The prewarm is stuck in its first call, this one times out and converts
+        assert [tool.name for tool in factory.get_smolagent_tools()] == ["echo"]
+    finally:
+        release.set()
+        factory._prewarm_thread.join(5.0)
+
+
+def test_failed_prewarm_falls_back_to_synchronous_build(catalog, monkeypatch):
+    factory = make_factory()
+    factory.service.tools = [make_mcp_tool("echo")]
+    get_tools = factory.service.get_tools
+    calls = factory.service.get_tools_calls
+    
+    def fail_first_call():
+        if factory.service.get_tools_calls == calls:
+            factory.service.get_tools_calls += 1
+            raise RuntimeError("server still starting")
+        return get_tools()
+        
+    monkeypatch.setattr(factory.service, "get_tools", fail_first_call)
+    factory.prewarm()
+    factory._prewarm_thread.join(5.0)
+    assert factory._smol_tools_cache is None
+    
+    assert [tool.name for tool in factory.get_smolagent_tools()] == ["echo"]
+
+
+def test_cached_tools_not_served_after_disconnect(catalog):
+    factory = make_factory()
+    factory.service.tools = [make_mcp_tool("echo")]
+    assert factory.get_smolagent_tools()
+    
+    factory.service.connected = False
+    with pytest.raises(factory_module.ServiceError):
+        factory.get_smolagent_tools()
+
+
+def test_create_new_passes_prewarm_timeout():
+    factory = SmolMCPToolFactory.create_new(
+        server_url="http://localhost:8000/sse", cache_dir=None, prewarm_timeout=5.0
+    )
+    
+    assert factory._prewarm_timeout == 5.0
+
+
+def test_catalog_failure_raises_conversion_error(catalog, monkeypatch):
+    smol_tools = pytest.importorskip("smolagents.tools")
+    
+    def unreachable(*args, **kwargs):
+        raise ConnectionError("connection refused")
+        
+    monkeypatch.setattr(smol_tools.ToolCollection, "from_mcp", staticmethod(unreachable))
+    factory = make_factory()
+    
+    with pytest.raises(factory_module.ConversionError, match="connection refused"):
+        factory.mcp_to_smolagent_tool(make_mcp_tool("echo"))
+
+
+def test_build_keeps_order_and_drops_failed_tools(catalog, monkeypatch):
+    factory = make_factory()
+    names = ["alpha", "bad-name", "beta", "broken", "gamma", "delta"]
+    factory.service.tools = [make_mcp_tool(name) for name in names]
+    convert = factory.converter.convert
+    
+    def slow_convert(mcp_tool, **kwargs):
+        # Finish the conversions roughly in reverse order
+        time.sleep(0.02 * (len(names) - names.index(mcp_tool.name)))
+        if mcp_tool.name == "broken":
+            raise RuntimeError("unexpected failure")
+        return convert(mcp_tool, **kwargs)
+        
+    monkeypatch.setattr(factory.converter, "convert", slow_convert)
+    
+    tools = factory.get_smolagent_tools()
+    
+    assert [tool.name for tool in tools] == ["alpha", "beta", "gamma", "delta"]
@@ -0,0 +1,265 @@
+import inspect
+
+import pytest
+
+pytest.importorskip("smolagents")
+
+import mcp_agent_tools.smol_tool_converter as converter_module
+from mcp_agent_tools.exceptions import ConversionError
+from mcp_agent_tools.smol_tool_converter import MCPToSmolToolConverter
+
+
+@pytest.fixture
+def converter():
+    return MCPToSmolToolConverter()
+
+
+def make_tool(func, name=None, description=None, inputs=None):
+    """Attach the MCP tool metadata to a plain function."""
+    func.name = name or func.__name__
+    func.description = description or f"{func.name} tool"
+    if inputs is not None:
+        func.inputs = inputs
+    return func
+
+
+@pytest.mark.parametrize("skip_validation", [False, True])
+def test_convert_function_tool(converter, skip_validation):
+    def echo(message: str, times: int = 1):
+        return message * times
+        
+    tool = converter.convert(make_tool(echo), skip_validation=skip_validation)
+    
+    assert tool.name == "echo"
+    assert tool.inputs["message"]["type"] == "string"
+    assert tool.inputs["times"] == {"type": "integer", "description": "Parameter: times", "nullable": True}
+    assert str(inspect.signature(tool.forward)) == "(message: str, times: int = 1)"
+    assert isinstance(tool, converter.SmolTool)
+
+
+def test_skip_validation_uses_non_validating_base(converter):
+    def echo(message: str):
+        return message
+        
+    tool = converter.convert(make_tool(echo), skip_validation=True)
+    
+    assert isinstance(tool, converter.create_non_validating_tool())
+
+
+@pytest.mark.parametrize("skip_validation", [False, True])
+def test_positional_and_keyword_calls(converter, skip_validation):
+    def echo(message: str, times: int = 1):
+        return message * times
+        
+    tool = converter.convert(make_tool(echo), skip_validation=skip_validation)
+    
+    assert tool("ab", 2) == "abab"
+    assert tool(message="ab") == "ab"
+    assert tool("ab", times=3) == "ababab"
+    with pytest.raises(TypeError):
+        tool("a", 1, 2)
+
+
+@pytest.mark.parametrize("skip_validation", [False, True])
+def test_required_input_after_nullable_is_keyword_only(converter, skip_validation):
+    def pair(a=None, *, b):
+        return (a, b)
+        
+    tool = converter.convert(make_tool(pair, inputs={
+        "a": {"type": "string", "description": "a", "nullable": True},
+        "b": {"type": "integer", "description": "b"},
+    }), skip_validation=skip_validation)
+    
+    params = inspect.signature(tool.forward).parameters
+    assert params["a"].default is None
+    assert params["b"].kind is inspect.Parameter.KEYWORD_ONLY
+    assert tool(b=3) == (None, 3)
+    assert tool("x", b=1) == ("x", 1)
+    with pytest.raises(TypeError):
+        tool("x", 2)
+
+
+@pytest.mark.parametrize("skip_validation", [False, True])
+def test_zero_input_tool(converter, skip_validation):
+    def ping():
+        return "pong"
+        
+    tool = converter.convert(make_tool(ping), skip_validation=skip_validation)
+    
+    assert tool.inputs == {}
+    assert str(inspect.signature(tool.forward)) == "()"
+    assert tool() == "pong"
+
+
+def test_schema_cache_reused_until_inputs_replaced(converter, monkeypatch):
+    def pair(a=None, *, b):
+        return (a, b)
+        
+    tool = make_tool(pair, inputs={"b": {"type": "integer", "description": "b"}})
+    converter.convert(tool, skip_validation=True)
+    
+    build = converter._build_metadata_and_inputs
+    calls = []
+    
+    def counting_build(*args, **kwargs):
+        calls.append(args)
+        return build(*args, **kwargs)
+        
+    monkeypatch.setattr(converter, "_build_metadata_and_inputs", counting_build)
+    
+    assert list(converter.convert(tool, skip_validation=True).inputs) == ["b"]
+    assert calls == []
+    
+    tool.inputs = {
+        "a": {"type": "string", "description": "a", "nullable": True},
+        "b": {"type": "integer", "description": "b"},
+    }
+    assert list(converter.convert(tool, skip_validation=True).inputs) == ["a", "b"]
+    assert len(calls) == 1
+    assert converter_module._schema_cache[tool][0] is tool.inputs
+
+
+def test_unparseable_string_annotation_with_default(converter):
+    def search(x: "list of str" = None):
+        return x
+        
+    tool = converter.convert(make_tool(search))
+    
+    assert tool.inputs["x"]["nullable"]
+    assert tool(x="a") == "a"
+
+
+def test_class_tool_with_unparseable_string_annotation(converter):
+    class Lookup:
+        name = "lookup"
+        description = "Lookup tool"
+        
+        def forward(self, x: "a b"):
+            return x
+            
+    tool = converter.convert(Lookup())
+    
+    assert tool.inputs == {"x": {"type": "any", "description": "Parameter: x"}}
+    assert tool(x=1) == 1
+
+
+def test_invalid_tool_name_raises_conversion_error(converter):
+    def bad(x):
+        return x
+        
+    with pytest.raises(ConversionError, match="bad-name"):
+        converter.convert(make_tool(bad, name="bad-name"))
+
+
+def test_missing_description_raises_value_error(converter):
+    def nameless():
+        return None
+        
+    nameless.name = "nameless"
+    with pytest.raises(ValueError):
+        converter.convert(nameless)
+
+
+def test_identical_input_entries_shared_between_tools(converter):
+    def first(message=None):
+        return message
+        
+    def second(message=None):
+        return message
+        
+    a = converter.convert(make_tool(first, inputs={"message": {"type": "string", "description": "Message"}}))
+    b = converter.convert(make_tool(second, inputs={"message": {"type": "string", "description": "Message"}}))
+    
+    assert a.inputs["message"] is b.inputs["message"]
+
+
+def test_input_entries_with_extra_keys_are_copied(converter):
+    raw = {"type": "str", "description": "Mode", "enum": ["fast", "slow"]}
+    
+    def pick(mode=None):
+        return mode
+        
+    tool = converter.convert(make_tool(pick, inputs={"mode": raw}), skip_validation=True)
+    
+    assert tool.inputs["mode"] == {"type": "string", "description": "Mode", "enum": ["fast", "slow"], "nullable": True}
+    assert raw == {"type": "str", "description": "Mode", "enum": ["fast", "slow"]}
+
+
+def test_zero_input_tools_share_class_forward(converter):
+    def ping():
+        return "pong"
+        
+    def pong():
+        return "ping"
+        
+    a = converter.convert(make_tool(ping))
+    b = converter.convert(make_tool(pong))
+    
+    assert "forward" not in vars(a) and "forward" not in vars(b)
+    assert type(a).forward is type(b).forward
+    with pytest.raises(TypeError):
+        a("unexpected")
+
+
+@pytest.mark.parametrize("type_hint, expected", [
+    ("string", "string"),
+    ("str", "string"),
+    ("int", "integer"),
+    ("float", "number"),
+    ("list", "array"),
+    ("dict", "object"),
+    ("None", "null"),
+    (str, "string"),
+    (bool, "boolean"),
+    (type(None), "null"),
+    ("List[str]", "string"),
+    ("Optional[int]", "integer"),
+    ("widget", "any"),
+    (["str"], "string"),
+])
+def test_normalize_input_type(converter, type_hint, expected):
+    assert converter._normalize_input_type(type_hint) == expected
+
+
+def test_string_types_normalized_in_inputs(converter):
+    def add(a=None, b=None):
+        return a + b
+        
+    tool = converter.convert(make_tool(add, inputs={
+        "a": {"type": "int", "description": "a"},
+        "b": {"type": "float", "description": "b"},
+    }), skip_validation=True)
+    
+    assert tool.inputs["a"]["type"] == "integer"
+    assert tool.inputs["b"]["type"] == "number"
+
+
+def test_same_parameter_shape_shares_signature(converter):
+    def first(message: str, times: int = 1):
+        return message
+        
+    def second(message: str, times: int = 1):
+        return message
+        
+    a = converter.convert(make_tool(first))
+    b = converter.convert(make_tool(second))
+    
+    assert inspect.signature(a.forward) is inspect.signature(b.forward)
+
+
+def test_signature_cache_distinguishes_equal_defaults(converter):
+    inputs = {"flag": {"type": "any", "description": "flag", "nullable": True}}
+    
+    as_bool = converter._build_forward_signature(inputs, {"flag": True})
+    as_int = converter._build_forward_signature(inputs, {"flag": 1})
+    
+    assert as_bool.parameters["flag"].default is True
+    assert type(as_int.parameters["flag"].default) is int
+
+
+def test_unhashable_default_builds_signature(converter):
+    inputs = {"items": {"type": "array", "description": "items", "nullable": True}}
+    
+    signature = converter._build_forward_signature(inputs, {"items": []})
+    
+    assert signature.parameters["items"].default == []